@@ -0,0 +1,6 @@
+"""
+B+ Tree time-series database.
+Heavy dependencies (NumPy, matplotlib) are only imported by the benchmark modules.
+"""
+
+from .bplustree import BPlusTree  # Import the B+ Tree implementation
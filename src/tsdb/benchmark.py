@@ -0,0 +1,292 @@
+import time
+import sys
+import os
+import subprocess
+import tempfile
+from bisect import bisect_left
+from math import ceil
+from .database import insert_record, search_exact_time, delete_record, range_query  # Import required functions from the database module
+from .bplustree import BPlusTree, Leaf  # Import the B+ Tree and its leaf node class
+from .bulkio import import_csv, import_binary, export_csv, export_binary  # Bulk loaders and exporters
+from .syntheticdata import write_data_csv  # Streams synthetic rows to a CSV file
+
+CLI_IMPORT_BUDGET = 0.1  # Seconds allowed for importing the CLI entry point
+
+# Function to plot the query performance results
+def plot_results(tree_times, sql_times):
+    # Imported here so the benchmarks run, and this module loads, without matplotlib installed
+    import matplotlib.pyplot as plt
+
+    # Set dark background theme
+    plt.style.use('dark_background')
+    
+    # Plot the times for the B+ Tree and SQL queries with custom colors
+    plt.plot(tree_times, label="B+ Tree", color='cyan', linewidth=2)
+    plt.plot(sql_times, label="SQL", color='magenta', linewidth=2)
+    
+    # Add a legend to differentiate the two lines
+    plt.legend(loc='best', facecolor='black', edgecolor='white')
+    
+    # Label the axes and add a title
+    plt.xlabel("Query Index", color='white')
+    plt.ylabel("Time (s)", color='white')
+    plt.title("Query Performance", color='white')
+    
+    # Customize gridlines
+    plt.grid(color='gray', linestyle='--', linewidth=0.5)
+    
+    # Customize tick colors
+    plt.xticks(color='white')
+    plt.yticks(color='white')
+    
+    # Display the plot
+    plt.show()
+
+# Function to benchmark insertion performance for both a B+ Tree and SQL database
+def benchmark_insertion(tree, cursor, dataset):
+    start_time = time.time()  # Record the start time
+    # Loop through the dataset, inserting each record into both the B+ Tree and the SQL database
+    for timestamp, value in dataset:
+        tree.insert(timestamp, value)  # Insert into the B+ Tree
+        insert_record(cursor, timestamp, value)  # Insert into the SQL database
+    return time.time() - start_time  # Return the total time taken for insertion
+
+# Function to benchmark query performance for both a B+ Tree and SQL database
+def benchmark_query(tree, cursor, queries):
+    tree_times = []  # List to store query times for the B+ Tree
+    sql_times = []  # List to store query times for the SQL database
+
+    for query in queries:
+        # Benchmark B+ Tree query
+        start_time = time.time()  # Record the start time
+        tree.query(query)  # Perform the query on the B+ Tree
+        tree_times.append(time.time() - start_time)  # Record the time taken
+
+        # Benchmark SQL query
+        start_time = time.time()  # Record the start time
+        search_exact_time(cursor, query)  # Perform the query on the SQL database
+        sql_times.append(time.time() - start_time)  # Record the time taken
+
+    return tree_times, sql_times  # Return the times for both the B+ Tree and SQL queries
+
+def benchmark_range_query(tree, cursor, ranges):
+    tree_times = []
+    sql_times = []
+
+    for start_time, end_time in ranges:
+        # Benchmark B+ Tree range query
+        start_time_measure = time.time()
+        tree_results = tree.range_query(start_time, end_time)
+        tree_times.append(time.time() - start_time_measure)
+
+        # Benchmark SQL range query
+        start_time_measure = time.time()
+        sql_results = range_query(cursor, start_time, end_time)
+        sql_times.append(time.time() - start_time_measure)
+
+    return tree_times, sql_times
+
+
+def benchmark_delete(tree, cursor, dataset):
+    tree_times = []
+    sql_times = []
+    for timestamp, _ in dataset:
+        # Benchmark B+ Tree deletion
+        start_time = time.time()
+        tree.delete(timestamp)
+        tree_times.append(time.time() - start_time)
+
+        # Benchmark SQL deletion
+        start_time = time.time()
+        delete_record(cursor, timestamp)
+        sql_times.append(time.time() - start_time)
+
+    return tree_times, sql_times
+
+
+
+def benchmark_nearest_query(tree, queries):
+    floor_times = []
+    ceil_times = []
+
+    for query in queries:
+        # Benchmark B+ Tree floor lookup
+        start_time = time.time()
+        tree.floor(query)
+        floor_times.append(time.time() - start_time)
+
+        # Benchmark B+ Tree ceil lookup
+        start_time = time.time()
+        tree.ceil(query)
+        ceil_times.append(time.time() - start_time)
+
+    return floor_times, ceil_times
+
+
+def benchmark_asof_join(tree, other_tree, start_key, end_key, tolerance=None):
+    # Benchmark the single-pass join over both leaf chains
+    start_time = time.time()
+    tree.asof_join(other_tree, start_key, end_key, tolerance)
+    join_time = time.time() - start_time
+
+    # Benchmark the same alignment done with one floor lookup per timestamp
+    start_time = time.time()
+    for key, _ in tree.range_query(start_key, end_key):
+        other_tree.floor(key)
+    lookup_time = time.time() - start_time
+
+    return join_time, lookup_time
+
+
+def benchmark_percentile(tree, ranges, q):
+    sketch_times = []
+    exact_times = []
+    rank_errors = []
+
+    for start_key, end_key in ranges:
+        # Benchmark the sketch-based percentile
+        start_time = time.time()
+        estimate = tree.percentile(start_key, end_key, q)
+        sketch_times.append(time.time() - start_time)
+
+        # Benchmark the exact percentile by materializing and sorting the range
+        start_time = time.time()
+        values = sorted(value for _, stored in tree.range_query(start_key, end_key) for value in stored)
+        exact = values[max(1, ceil(q * len(values))) - 1] if values else None
+        exact_times.append(time.time() - start_time)
+
+        # Measure accuracy as the distance between the estimate's rank and the requested rank
+        if values:
+            rank_errors.append(abs(bisect_left(values, estimate) - bisect_left(values, exact)) / len(values))
+
+    return sketch_times, exact_times, rank_errors
+
+
+def benchmark_topk(tree, ranges, k):
+    sketch_times = []
+    exact_times = []
+    recalls = []
+
+    for start_key, end_key in ranges:
+        # Benchmark the heap-based top-k
+        start_time = time.time()
+        estimate = tree.topk(start_key, end_key, k)
+        sketch_times.append(time.time() - start_time)
+
+        # Benchmark the exact top-k by materializing and sorting the range
+        start_time = time.time()
+        values = sorted((value for _, stored in tree.range_query(start_key, end_key) for value in stored), reverse=True)
+        exact = values[:k]
+        exact_times.append(time.time() - start_time)
+
+        # Fraction of the exact top-k found by the heap-based query
+        if exact:
+            recalls.append(len(set(estimate) & set(exact)) / len(exact))
+
+    return sketch_times, exact_times, recalls
+
+
+def benchmark_learned_query(tree, queries):
+    tree_times = []
+    learned_times = []
+    learned = tree.learned if tree.learned is not None else tree.enable_learned_index()
+
+    # Benchmark point queries through B+ Tree descent only
+    tree.learned = None
+    for query in queries:
+        start_time = time.time()
+        tree.query(query)
+        tree_times.append(time.time() - start_time)
+
+    # Benchmark point queries through the learned index
+    tree.learned = learned
+    for query in queries:
+        start_time = time.time()
+        tree.query(query)
+        learned_times.append(time.time() - start_time)
+
+    return tree_times, learned_times
+
+
+def index_memory(tree):
+    # Estimate the memory of the internal nodes used for descent versus the learned index
+    tree_bytes = 0
+    nodes = [tree.root]
+    while nodes:
+        node = nodes.pop()
+        if type(node) is Leaf:
+            continue
+        tree_bytes += sys.getsizeof(node) + sys.getsizeof(node.__dict__)
+        tree_bytes += sys.getsizeof(node.keys) + sys.getsizeof(node.values)
+        nodes.extend(node.values)
+
+    learned_bytes = tree.learned.memory() if tree.learned is not None else 0
+    return tree_bytes, learned_bytes
+
+
+def benchmark_sorted_insert(dataset):
+    # Compare a plain insert() loop with insert_sorted(), which reuses the current leaf for ascending keys
+    tree = BPlusTree()
+    start_time = time.time()
+    for timestamp, value in dataset:
+        tree.insert(timestamp, value)
+    loop_time = time.time() - start_time
+
+    tree = BPlusTree()
+    start_time = time.time()
+    tree.insert_sorted(dataset)
+    sorted_time = time.time() - start_time
+    return loop_time, sorted_time
+
+
+def benchmark_bulk_io(num_records, processes=None):
+    # Measure rows per second for bulk import and export through temporary files.
+    # Imports run both in-process and on a process pool so the two can be compared side by side.
+    rates = {}
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "data.csv")
+        binary_path = os.path.join(directory, "data.bin")
+        write_data_csv(csv_path, num_records)
+
+        for label, workers in (("serial", 0), ("pooled", processes)):
+            tree = BPlusTree()
+            start_time = time.time()
+            rows = import_csv(tree, csv_path, workers)
+            rates[f"import_csv ({label})"] = rows / (time.time() - start_time)
+
+        start_time = time.time()
+        rows = export_csv(tree, csv_path)
+        rates["export_csv"] = rows / (time.time() - start_time)
+
+        start_time = time.time()
+        rows = export_binary(tree, binary_path)
+        rates["export_binary"] = rows / (time.time() - start_time)
+
+        for label, workers in (("serial", 0), ("pooled", processes)):
+            tree = BPlusTree()
+            start_time = time.time()
+            rows = import_binary(tree, binary_path, workers)
+            rates[f"import_binary ({label})"] = rows / (time.time() - start_time)
+
+    return rates
+
+
+def benchmark_import_time(module, runs=5):
+    # Measure the wall time of a fresh interpreter importing the module, minus a bare interpreter start.
+    # The interpreter runs from the directory holding the tsdb package, so source checkouts work too.
+    def launch(code):
+        start_time = time.time()
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        return time.time() - start_time
+
+    baseline = min(launch("pass") for _ in range(runs))
+    return min(launch(f"import {module}") for _ in range(runs)) - baseline
+
+
+def check_import_budget(module="tsdb.cli", budget=CLI_IMPORT_BUDGET):
+    # Fail when importing the module takes longer than the budget, so short-lived processes stay fast
+    import_time = benchmark_import_time(module)
+    print(f"{module} import time: {import_time:.3f} seconds (budget {budget:.3f} seconds)")
+    if import_time > budget:
+        raise AssertionError(f"importing {module} took {import_time:.3f} seconds, over the {budget:.3f} second budget")
+    return import_time
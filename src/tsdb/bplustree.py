@@ -3,6 +3,10 @@
 
 
 import random  # For generating random values in demo tests
+from bisect import bisect_left, bisect_right  # For locating keys within sorted leaf keys
+from math import ceil  # For nearest-rank percentiles
+from .sketch import Summary, TOPK_SIZE  # Mergeable quantile/top-k summaries
+from .learnedindex import LearnedIndex  # Optional learned index over the leaf chain
 
 # Global counters to track operations performed on the B+ Tree
 splits = 0  # Number of node splits
@@ -27,6 +31,7 @@ class Node(object):
         self.keys: list = []  # List of keys stored in the node
         self.values: list[Node] = []  # List of pointers to child nodes or data
         self.parent: Node = parent  # Reference to the parent node
+        self.summary: Summary = None  # Cached summary of the subtree, None when stale
 
     def index(self, key):
         """
@@ -161,6 +166,17 @@ class Node(object):
 
         return False  # If borrowing is not possible, return False
 
+    def summarize(self) -> Summary:
+        """
+        Return the summary of every value stored below this node, merging child summaries if needed.
+        :return: The cached Summary of the subtree.
+        """
+        if self.summary is None:
+            self.summary = Summary()
+            for child in self.values:
+                self.summary.merge(child.summarize())
+        return self.summary
+
 
 
 class Leaf(Node):
@@ -198,12 +214,12 @@ class Leaf(Node):
         :param key: The key to insert or update.
         :param value: The value to associate with the key.
         """
-        i = self.index(key)  # Determine the correct position for the key
         if key not in self.keys:
+            i = self.index(key)  # Determine the correct position for the key
             self.keys.insert(i, key)  # Insert the key at the correct position
             self.values.insert(i, [value])  # Store the value in a list to handle duplicates
         else:
-            self.values[i].append(value)  # Append the value to the existing list for duplicates
+            self.values[self.keys.index(key)].append(value)  # Append the value to the existing list for duplicates
 
     def split(self):
         """
@@ -284,6 +300,18 @@ class Leaf(Node):
 
         return False  # Return False if no borrowing is possible
 
+    def summarize(self) -> Summary:
+        """
+        Return the summary of every value stored in this leaf, building it if needed.
+        :return: The cached Summary of the leaf.
+        """
+        if self.summary is None:
+            self.summary = Summary()
+            for values in self.values:
+                for value in values:
+                    self.summary.update(value)
+        return self.summary
+
 class BPlusTree(object):
     """
     Represents a B+ tree, consisting of nodes (internal and leaf).
@@ -301,6 +329,7 @@ class BPlusTree(object):
         self.maximum: int = maximum if maximum > 2 else 2  # Minimum capacity is 2
         self.minimum: int = self.maximum // 2  # Minimum number of keys per node
         self.depth = 0  # Tree depth starts at 0
+        self.learned: LearnedIndex = None  # Optional learned index, see enable_learned_index()
 
     def find(self, key) -> Leaf:
         """
@@ -314,6 +343,29 @@ class BPlusTree(object):
             node = node[key]  # Move to the child node based on the key
         return node
 
+    def enable_learned_index(self, epsilon=4) -> LearnedIndex:
+        """
+        Build a learned index over the leaf chain and use it for point and nearest-key lookups.
+        It is kept up to date as leaves split and merge. Set `tree.learned = None` to disable it.
+        :param epsilon: Maximum position error of each fitted segment.
+        :return: The LearnedIndex instance.
+        """
+        self.learned = LearnedIndex(self, epsilon)
+        self.learned.build()
+        return self.learned
+
+    def lookup(self, key) -> Leaf:
+        """
+        Locate the leaf for a read, using the learned index when enabled and falling back to find().
+        :param key: The key to find.
+        :return: The leaf node where the key resides or should reside.
+        """
+        if self.learned is not None:
+            leaf = self.learned.lookup(key)
+            if leaf is not None:
+                return leaf
+        return self.find(key)
+
     def __getitem__(self, item):
         """
         Retrieve the value(s) associated with a given key.
@@ -328,7 +380,7 @@ class BPlusTree(object):
         :param key: The key to search for.
         :return: The value(s) associated with the key, or None.
         """
-        leaf = self.find(key)  # Find the leaf containing the key
+        leaf = self.lookup(key)  # Find the leaf containing the key
         return leaf[key] if key in leaf.keys else None  # Return the value(s) or None
 
     def range_query(self, start_key, end_key):
@@ -351,6 +403,259 @@ class BPlusTree(object):
 
             return results
 
+    def iter_range(self, start_key=None, end_key=None):
+        """
+        Lazily yield key-value pairs in the range [start_key, end_key] by walking the leaf chain.
+        Unlike range_query, nothing is materialized, so arbitrarily large ranges can be streamed.
+        :param start_key: The starting key of the range. If None, start at the smallest key.
+        :param end_key: The ending key of the range. If None, continue to the largest key.
+        :return: A generator of (key, value) pairs in ascending key order.
+        """
+        leaf = self.leftmost_leaf() if start_key is None else self.find(start_key)
+
+        while leaf:
+            for key, value in zip(leaf.keys, leaf.values):
+                if end_key is not None and key > end_key:
+                    return
+                if start_key is None or start_key <= key:
+                    yield key, value
+            leaf = leaf.next  # Move to the next leaf node
+
+    def _locate_floor(self, key):
+        """
+        Locate the position of the largest key less than or equal to the given key.
+        :param key: The key to search for.
+        :return: A tuple (Leaf, index) for the matching entry, or None if no such key exists.
+        """
+        leaf = self.lookup(key)
+        i = bisect_right(leaf.keys, key) - 1  # Last key <= key within this leaf
+        while i < 0:
+            leaf = leaf.prev  # Every key in this leaf is larger, step back along the chain
+            if leaf is None:
+                return None
+            i = len(leaf.keys) - 1
+        return leaf, i
+
+    def _locate_ceil(self, key):
+        """
+        Locate the position of the smallest key greater than or equal to the given key.
+        :param key: The key to search for.
+        :return: A tuple (Leaf, index) for the matching entry, or None if no such key exists.
+        """
+        leaf = self.lookup(key)
+        i = bisect_left(leaf.keys, key)  # First key >= key within this leaf
+        while i >= len(leaf.keys):
+            leaf = leaf.next  # Every key in this leaf is smaller, step forward along the chain
+            if leaf is None:
+                return None
+            i = 0
+        return leaf, i
+
+    def floor(self, key):
+        """
+        Retrieve the entry with the largest key less than or equal to the given key.
+        :param key: The key to search for.
+        :return: A (key, value) pair, or None if every key is larger.
+        """
+        position = self._locate_floor(key)
+        if position is None:
+            return None
+        leaf, i = position
+        return leaf.keys[i], leaf.values[i]
+
+    def ceil(self, key):
+        """
+        Retrieve the entry with the smallest key greater than or equal to the given key.
+        :param key: The key to search for.
+        :return: A (key, value) pair, or None if every key is smaller.
+        """
+        position = self._locate_ceil(key)
+        if position is None:
+            return None
+        leaf, i = position
+        return leaf.keys[i], leaf.values[i]
+
+    def last_before(self, key, n):
+        """
+        Retrieve the last n entries with keys less than or equal to the given key.
+        :param key: The key to search for.
+        :param n: The maximum number of entries to return.
+        :return: A list of up to n key-value pairs in ascending key order.
+        """
+        results = []
+        position = self._locate_floor(key)
+        if position is None or n <= 0:
+            return results
+        leaf, i = position
+
+        # Walk the leaf chain backwards until n entries have been collected
+        while leaf is not None and len(results) < n:
+            while i >= 0 and len(results) < n:
+                results.append((leaf.keys[i], leaf.values[i]))
+                i -= 1
+            leaf = leaf.prev
+            if leaf is not None:
+                i = len(leaf.keys) - 1
+
+        results.reverse()
+        return results
+
+    def asof_join(self, other_tree, start_key, end_key, tolerance=None):
+        """
+        Align every entry in [start_key, end_key] with the last entry of another tree at or before its key.
+        Both leaf chains are merged in a single linear pass.
+        :param other_tree: The BPlusTree to join against.
+        :param start_key: The starting key of the range.
+        :param end_key: The ending key of the range.
+        :param tolerance: Maximum allowed distance between the two keys. If None, any distance is accepted.
+        :return: A list of (key, value, other_key, other_value) tuples; the other fields are None when nothing matches.
+        """
+        results = []
+        position = self._locate_ceil(start_key)
+        if position is None:
+            return results
+        leaf, i = position
+
+        # Start the other cursor at the last entry at or before the first joined key
+        other = other_tree._locate_floor(leaf.keys[i])
+        if other is None:
+            other_leaf, j = other_tree.leftmost_leaf(), -1
+        else:
+            other_leaf, j = other
+
+        while leaf is not None:
+            while i < len(leaf.keys):
+                key = leaf.keys[i]
+                if key > end_key:
+                    return results
+
+                # Advance the other cursor while its next key is still at or before the current key
+                while True:
+                    if j + 1 < len(other_leaf.keys):
+                        if other_leaf.keys[j + 1] > key:
+                            break
+                        j += 1
+                    elif other_leaf.next is not None and other_leaf.next.keys and other_leaf.next.keys[0] <= key:
+                        other_leaf, j = other_leaf.next, 0
+                    else:
+                        break
+
+                if j >= 0 and (tolerance is None or key - other_leaf.keys[j] <= tolerance):
+                    results.append((key, leaf.values[i], other_leaf.keys[j], other_leaf.values[j]))
+                else:
+                    results.append((key, leaf.values[i], None, None))
+                i += 1
+            leaf = leaf.next  # Move to the next leaf node
+            i = 0
+
+        return results
+
+    def _collect(self, node, low, high, start_key, end_key, summaries, values):
+        """
+        Gather summaries of subtrees fully inside [start_key, end_key] and raw values from boundary leaves.
+        :param node: The node to visit.
+        :param low: Inclusive lower bound of the node's keys, or None if unbounded.
+        :param high: Exclusive upper bound of the node's keys, or None if unbounded.
+        :param start_key: The starting key of the range.
+        :param end_key: The ending key of the range.
+        :param summaries: List collecting the summaries of covered subtrees.
+        :param values: List collecting the values from partially covered leaves.
+        """
+        if type(node) is Leaf:
+            if node.keys and start_key <= node.keys[0] and node.keys[-1] <= end_key:
+                summaries.append(node.summarize())  # Whole leaf is inside the range
+            else:
+                for key, value in zip(node.keys, node.values):
+                    if start_key <= key <= end_key:
+                        values.extend(value)
+            return
+
+        if low is not None and high is not None and start_key <= low and high <= end_key:
+            summaries.append(node.summarize())  # Whole subtree is inside the range
+            return
+
+        for i, child in enumerate(node.values):
+            child_low = node.keys[i - 1] if i > 0 else low
+            child_high = node.keys[i] if i < len(node.keys) else high
+            if child_high is not None and child_high <= start_key:
+                continue  # Child lies entirely before the range
+            if child_low is not None and child_low > end_key:
+                break  # This and every following child lie after the range
+            self._collect(child, child_low, child_high, start_key, end_key, summaries, values)
+
+    def percentile(self, start_key, end_key, q):
+        """
+        Estimate the q-quantile of the values in the range [start_key, end_key].
+        Fully covered subtrees contribute their cached sketches; only boundary leaves are scanned.
+        The result is exact when the range touches no fully covered subtree.
+        :param start_key: The starting key of the range.
+        :param end_key: The ending key of the range.
+        :param q: Quantile in [0, 1], e.g. 0.99 for the 99th percentile.
+        :return: The (estimated) value at that quantile, or None if the range is empty.
+        """
+        summaries, values = [], []
+        self._collect(self.root, None, None, start_key, end_key, summaries, values)
+
+        if not summaries:
+            # Only boundary values, so compute the exact nearest-rank percentile
+            if not values:
+                return None
+            values.sort()
+            return values[max(1, ceil(q * len(values))) - 1]
+
+        merged = Summary()
+        for summary in summaries:
+            merged.sketch.merge(summary.sketch)
+        for value in values:
+            merged.sketch.update(value)
+        return merged.sketch.quantile(q)
+
+    def topk(self, start_key, end_key, k):
+        """
+        Retrieve the k largest values in the range [start_key, end_key].
+        Fully covered subtrees contribute their cached top-k heaps; only boundary leaves are scanned.
+        Requests larger than the heap capacity fall back to a full scan of the range.
+        :param start_key: The starting key of the range.
+        :param end_key: The ending key of the range.
+        :param k: Number of values to return.
+        :return: A list of up to k values in descending order.
+        """
+        if k > TOPK_SIZE:
+            values = [value for _, stored in self.range_query(start_key, end_key) for value in stored]
+            values.sort(reverse=True)
+            return values[:k]
+
+        summaries, values = [], []
+        self._collect(self.root, None, None, start_key, end_key, summaries, values)
+
+        merged = Summary()
+        for summary in summaries:
+            merged.top.merge(summary.top)
+        for value in values:
+            merged.top.update(value)
+        return merged.top.largest(k)
+
+    def _touch(self, node: Node):
+        """
+        Mark the cached summaries of a node and its ancestors as stale.
+        An ancestor's summary is only built after its children's, so the walk stops at the first stale node.
+        :param node: The node whose contents changed. None is ignored.
+        """
+        while node is not None and node.summary is not None:
+            node.summary = None
+            node = node.parent
+
+    def _touch_siblings(self, node: Node):
+        """
+        Mark the cached summaries of a node's siblings as stale before they lend or absorb keys.
+        :param node: The underfull node being rebalanced.
+        """
+        for sibling in node.parent.values:
+            self._touch(sibling)
+        if type(node) is Leaf:
+            self._touch(node.prev)
+            self._touch(node.next)
+
     def change(self, key, value):
         """
         Update the value associated with a key.
@@ -363,6 +668,7 @@ class BPlusTree(object):
             return False, leaf  # Key does not exist
         else:
             leaf[key] = value  # Update the key-value pair
+            self._touch(leaf)
             return True, leaf
 
     def __setitem__(self, key, value, leaf=None):
@@ -376,8 +682,12 @@ class BPlusTree(object):
         if leaf is None:
             leaf = self.find(key)  # Find the appropriate leaf for the key
         leaf[key] = value  # Insert or update the key-value pair
+        self._touch(leaf)
         if len(leaf.keys) > self.maximum:
-            self.insert_index(*leaf.split())  # Split the node if it exceeds capacity
+            split_key, nodes = leaf.split()  # Split the node if it exceeds capacity
+            self.insert_index(split_key, nodes)
+            if self.learned is not None:
+                self.learned.leaf_split(*nodes)
 
     def insert(self, key, value):
         """
@@ -393,6 +703,46 @@ class BPlusTree(object):
             self.__setitem__(key, value, leaf)  # Insert the key-value pair
             return True, leaf
 
+    def _find_bounded(self, key):
+        """
+        Locate the leaf for a key together with the separator keys bounding that leaf.
+        :param key: The key to find.
+        :return: A tuple (Leaf, low, high) where the leaf accepts keys in [low, high); None means unbounded.
+        """
+        node, low, high = self.root, None, None
+        while type(node) is not Leaf:
+            i = node.index(key)
+            if i > 0:
+                low = node.keys[i - 1]  # Deeper separators are always tighter
+            if i < len(node.keys):
+                high = node.keys[i]
+            node = node.values[i]
+        return node, low, high
+
+    def insert_sorted(self, items):
+        """
+        Insert a batch of key-value pairs, reusing the current leaf while keys stay within its bounds.
+        Works for any order, but sorted input avoids a tree descent for most keys.
+        A value for a key that already exists is appended to that key's value list, so repeated keys are kept.
+        :param items: Iterable of (key, value) pairs, ideally in ascending key order.
+        :return: The number of pairs inserted.
+        """
+        inserted = 0
+        leaf, low, high = None, None, None
+
+        for key, value in items:
+            if leaf is None or (low is not None and key < low) or (high is not None and key >= high):
+                leaf, low, high = self._find_bounded(key)  # Key left the cached leaf's bounds
+
+            size = len(leaf.keys)
+            self.__setitem__(key, value, leaf)
+            inserted += 1
+            if len(leaf.keys) < size:
+                # The leaf split and kept the upper half, where the next ascending key belongs
+                low = leaf.keys[0]
+
+        return inserted
+
     def insert_index(self, key, values: list[Node]):
         """
         Insert a key and associated child nodes into the parent node.
@@ -421,6 +771,7 @@ class BPlusTree(object):
         if node is None:
             node = self.find(key)  # Locate the node containing the key
         del node[key]  # Remove the key and associated value(s)
+        self._touch(node)
 
         if len(node.keys) < self.minimum:
             if node == self.root:
@@ -431,9 +782,14 @@ class BPlusTree(object):
                     self.depth -= 1  # Decrease tree depth
                 return
 
+            # Siblings may lend or absorb keys, so their summaries become stale
+            self._touch_siblings(node)
+
             # Borrow a key or merge nodes if underutilized
-            elif not node.borrow_key(self.minimum):
+            if not node.borrow_key(self.minimum):
                 node.fusion()  # Merge with a sibling
+                if self.learned is not None and type(node) is Leaf:
+                    self.learned.leaf_removed(node)
                 self.delete(key, node.parent)  # Recursively clean up the parent
 
     def show(self, node=None, file=None, _prefix="", _last=True):
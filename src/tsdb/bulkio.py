@@ -0,0 +1,269 @@
+import csv
+import os
+import struct
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+# Binary files are a sequence of blocks: a block header followed by its records.
+# Each record is a timestamp (microseconds since 1970-01-01, naive) and a UTF-8 value.
+BLOCK_HEADER = struct.Struct("<II")  # Record count, payload size in bytes
+RECORD_HEADER = struct.Struct("<qI")  # Timestamp in microseconds, value size in bytes
+CHUNK_RECORDS = 65536  # Records per CSV chunk or binary block
+_EPOCH = datetime(1970, 1, 1)
+
+
+def parse_timestamp(text):
+    """
+    Parse an ISO 8601 timestamp into a naive datetime.
+    Accepted forms are those of datetime.fromisoformat on Python 3.10: `YYYY-MM-DD[THH[:MM[:SS[.fff[fff]]]]]`
+    with an optional `+HH:MM` offset, plus a trailing `Z` for UTC.
+    Timezone-aware timestamps are converted to UTC, so naive and aware inputs can share a tree.
+    :param text: The timestamp text.
+    :return: A naive datetime.
+    """
+    if text.endswith(("Z", "z")):
+        text = text[:-1] + "+00:00"  # fromisoformat only accepts the Z suffix from Python 3.11
+    timestamp = datetime.fromisoformat(text)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+
+def _parse_csv_chunk(rows):
+    """
+    Parse CSV rows of `timestamp,value` into key-value pairs sorted by timestamp.
+    Runs in a worker process.
+    :param rows: List of rows already split into fields by csv.reader.
+    :return: A sorted list of (datetime, value) pairs.
+    """
+    records = []
+    for row in rows:
+        if len(row) != 2:
+            raise ValueError(f"expected a 'timestamp,value' row, got {row!r}")
+        records.append((parse_timestamp(row[0]), row[1]))
+    records.sort(key=lambda record: record[0])
+    return records
+
+
+def _iter_records(payload):
+    """
+    Decode the records of one binary block in stored order.
+    :param payload: The block's record bytes.
+    :return: A generator of (datetime, value) pairs.
+    """
+    offset = 0
+    while offset < len(payload):
+        micros, size = RECORD_HEADER.unpack_from(payload, offset)
+        offset += RECORD_HEADER.size
+        value = payload[offset:offset + size].decode("utf-8")
+        offset += size
+        yield _EPOCH + timedelta(microseconds=micros), value
+
+
+def _decode_block(payload):
+    """
+    Decode one binary block into key-value pairs sorted by timestamp.
+    Runs in a worker process.
+    :param payload: The block's record bytes.
+    :return: A sorted list of (datetime, value) pairs.
+    """
+    records = list(_iter_records(payload))
+    records.sort(key=lambda record: record[0])
+    return records
+
+
+def _encode_record(key, value):
+    """
+    Encode one key-value pair as a binary record.
+    :param key: A naive datetime key.
+    :param value: The value, stored as text.
+    :return: The record bytes.
+    """
+    if not isinstance(key, datetime) or key.tzinfo is not None:
+        raise ValueError(f"binary records need naive datetime keys, got {key!r}")
+    data = str(value).encode("utf-8")
+    micros = (key - _EPOCH) // timedelta(microseconds=1)
+    return RECORD_HEADER.pack(micros, len(data)) + data
+
+
+def _load(tree, chunks, worker, processes):
+    """
+    Decode chunks, optionally on a process pool, and feed the sorted results to the tree in order.
+    The parent still inserts every record and must pickle chunks to the workers and results back,
+    so the pool is opt-in; see benchmark_bulk_io for serial and pooled rates.
+    At most two chunks per process are in flight, so memory stays bounded for large files.
+    :param tree: The BPlusTree to load.
+    :param chunks: Iterable of raw chunks accepted by `worker`.
+    :param worker: Function turning a raw chunk into sorted (key, value) pairs.
+    :param processes: Number of worker processes. 0 decodes in this process; None uses every CPU.
+    :return: The number of records inserted.
+    """
+    if processes == 0:
+        return sum(tree.insert_sorted(worker(chunk)) for chunk in chunks)
+
+    # Imported here so short-lived processes that never start a pool skip its import cost
+    from concurrent.futures import ProcessPoolExecutor
+
+    inserted = 0
+    with ProcessPoolExecutor(processes) as pool:
+        limit = 2 * (processes or os.cpu_count() or 1)
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(worker, chunk))
+            if len(pending) >= limit:
+                inserted += tree.insert_sorted(pending.popleft().result())
+        while pending:
+            inserted += tree.insert_sorted(pending.popleft().result())
+    return inserted
+
+
+def _csv_chunks(file, chunk_records):
+    """
+    Split an open CSV file into lists of rows, skipping empty rows.
+    Records are split here so quoted values spanning several lines stay intact;
+    timestamp parsing is left to the worker function.
+    :param file: The open text file.
+    :param chunk_records: Rows per chunk.
+    :return: A generator of row lists.
+    """
+    rows = (row for row in csv.reader(file) if row)
+    while True:
+        chunk = list(islice(rows, chunk_records))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _binary_blocks(file):
+    """
+    Split an open binary file into block payloads.
+    :param file: The open binary file.
+    :return: A generator of payload bytes.
+    """
+    while True:
+        header = file.read(BLOCK_HEADER.size)
+        if not header:
+            return
+        _, size = BLOCK_HEADER.unpack(header)
+        yield file.read(size)
+
+
+def import_csv(tree, path, processes=0, chunk_records=CHUNK_RECORDS, header=False):
+    """
+    Load a CSV file of `timestamp,value` rows (ISO 8601 timestamps) into a tree.
+    Timezone-aware timestamps are stored as naive UTC; empty rows are skipped.
+    :param tree: The BPlusTree to load.
+    :param path: Path of the CSV file.
+    :param processes: Number of parsing processes. 0 (the default) parses in this process; None uses every CPU.
+    :param chunk_records: Rows per parsed chunk.
+    :param header: True if the first line is a header row to skip.
+    :return: The number of records inserted. Values for a timestamp already in the tree are appended to it.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        if header:
+            next(file, None)  # The header is assumed to fit on one line
+        return _load(tree, _csv_chunks(file, chunk_records), _parse_csv_chunk, processes)
+
+
+def import_binary(tree, path, processes=0):
+    """
+    Load a binary file written by export_binary into a tree.
+    :param tree: The BPlusTree to load.
+    :param path: Path of the binary file.
+    :param processes: Number of decoding processes. 0 (the default) decodes in this process; None uses every CPU.
+    :return: The number of records inserted. Values for a timestamp already in the tree are appended to it.
+    """
+    with open(path, "rb") as file:
+        return _load(tree, _binary_blocks(file), _decode_block, processes)
+
+
+def iter_binary(path, start_key=None):
+    """
+    Stream the records of a binary file written by export_binary, in key order, without building a tree.
+    With a start key, whole blocks are skipped by reading only their first record, and streaming
+    begins at the block holding the last record at or before the start key (or the first block).
+    :param path: Path of the binary file.
+    :param start_key: Key to seek to. If None, stream from the first record.
+    :return: A generator of (datetime, value) pairs, one per stored value.
+    """
+    with open(path, "rb") as file:
+        previous = None  # Offset and size of the last block starting at or before start_key
+        while start_key is not None:
+            header = file.read(BLOCK_HEADER.size)
+            if not header:
+                break
+            _, size = BLOCK_HEADER.unpack(header)
+            offset = file.tell()
+            micros, _ = RECORD_HEADER.unpack(file.read(RECORD_HEADER.size))
+            if _EPOCH + timedelta(microseconds=micros) > start_key:
+                file.seek(offset - BLOCK_HEADER.size)  # Stream from this block onwards
+                break
+            previous = offset, size
+            file.seek(offset + size)
+
+        if previous is not None:
+            resume = file.tell()
+            file.seek(previous[0])
+            yield from _iter_records(file.read(previous[1]))
+            file.seek(resume)
+
+        for payload in _binary_blocks(file):
+            yield from _iter_records(payload)
+
+
+def export_csv(tree, path, start_key=None, end_key=None):
+    """
+    Stream the records in [start_key, end_key] to a CSV file without materializing the range.
+    :param tree: The BPlusTree to export.
+    :param path: Path of the CSV file to write.
+    :param start_key: The starting key of the range. If None, start at the smallest key.
+    :param end_key: The ending key of the range. If None, continue to the largest key.
+    :return: The number of rows written.
+    """
+    rows = 0
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        for key, values in tree.iter_range(start_key, end_key):
+            for value in values:  # One row per value stored under the timestamp
+                writer.writerow((key.isoformat(), value))
+                rows += 1
+    return rows
+
+
+def export_binary(tree, path, start_key=None, end_key=None, block_records=CHUNK_RECORDS):
+    """
+    Stream the records in [start_key, end_key] to a binary file without materializing the range.
+    :param tree: The BPlusTree to export. Keys must be naive datetimes.
+    :param path: Path of the binary file to write.
+    :param start_key: The starting key of the range. If None, start at the smallest key.
+    :param end_key: The ending key of the range. If None, continue to the largest key.
+    :param block_records: Records per block; a block may run over to keep all values of a key together.
+    :return: The number of records written.
+    """
+    rows = 0
+    block = []
+    with open(path, "wb") as file:
+        for key, values in tree.iter_range(start_key, end_key):
+            for value in values:
+                block.append(_encode_record(key, value))
+            if len(block) >= block_records:
+                # Blocks only end between keys, so iter_binary can seek to a key without splitting its values
+                _write_block(file, block)
+                rows += len(block)
+                block = []
+        if block:
+            _write_block(file, block)
+            rows += len(block)
+    return rows
+
+
+def _write_block(file, records):
+    """
+    Write one block of encoded records.
+    :param file: The open binary file.
+    :param records: List of encoded record bytes.
+    """
+    payload = b"".join(records)
+    file.write(BLOCK_HEADER.pack(len(records), len(payload)))
+    file.write(payload)
@@ -0,0 +1,266 @@
+import argparse
+import csv
+import os
+import sys
+from collections import deque
+from itertools import groupby
+from operator import itemgetter
+
+from .bplustree import BPlusTree  # Import the B+ Tree implementation
+from .bulkio import import_csv, import_binary, iter_binary, export_binary, parse_timestamp  # Bulk loaders and exporters
+
+# Only lightweight modules are imported above. Plotting, NumPy and the HTTP server are
+# imported inside the subcommands that need them, so short-lived query processes start fast.
+
+
+def open_tree(store) -> BPlusTree:
+    """
+    Load a tree from a store file written by export_binary. Used by ingest and serve; query streams instead.
+    :param store: Path of the store file. A missing file gives an empty tree.
+    :return: The loaded BPlusTree.
+    """
+    tree = BPlusTree()
+    if os.path.exists(store):
+        import_binary(tree, store)
+    return tree
+
+
+def save_tree(tree, store):
+    """
+    Write a tree to a store file, replacing it atomically.
+    :param tree: The BPlusTree to save.
+    :param store: Path of the store file.
+    :return: The number of records written.
+    """
+    temporary = store + ".tmp"
+    try:
+        rows = export_binary(tree, temporary)
+    except Exception:
+        if os.path.exists(temporary):
+            os.remove(temporary)  # Never leave a partial store behind
+        raise
+    os.replace(temporary, store)
+    return rows
+
+
+def ingest(args):
+    """
+    Import a CSV or binary file into the store.
+    :param args: Parsed command-line arguments.
+    :return: Exit status.
+    """
+    tree = open_tree(args.store)
+    file_format = args.format or ("csv" if args.source.lower().endswith(".csv") else "binary")
+    if file_format == "csv":
+        inserted = import_csv(tree, args.source, args.processes, header=args.header)
+    else:
+        inserted = import_binary(tree, args.source, args.processes)
+    rows = save_tree(tree, args.store)
+    print(f"Ingested {inserted} rows into {args.store} ({rows} rows total)")
+    return 0
+
+
+def scan_store(store, start_key=None):
+    """
+    Stream a store file in key order without loading it into a tree.
+    :param store: Path of the store file. A missing file yields nothing.
+    :param start_key: Key to seek to, see bulkio.iter_binary. If None, scan from the first record.
+    :return: A generator of (key, values) pairs with all values of a key grouped, like tree entries.
+    """
+    if not os.path.exists(store):
+        return
+    for key, records in groupby(iter_binary(store, start_key), key=itemgetter(0)):
+        yield key, [value for _, value in records]
+
+
+def select(entries, args):
+    """
+    Pick the entries a query asks for from a key-ordered stream, stopping as early as possible.
+    :param entries: Iterable of (key, values) pairs in ascending key order.
+    :param args: Parsed command-line arguments.
+    :return: A list of matching (key, values) pairs.
+    """
+    at = args.at
+    if at is None:
+        results = []
+        for key, values in entries:
+            if args.end is not None and key > args.end:
+                break
+            if key >= args.start:
+                results.append((key, values))
+        return results
+
+    if args.last is not None or args.mode == "floor":
+        # Keep a rolling buffer of the entries at or before the timestamp
+        recent = deque(maxlen=args.last if args.last is not None else 1)
+        for key, values in entries:
+            if key > at:
+                break
+            recent.append((key, values))
+        return list(recent)
+
+    for key, values in entries:
+        if key >= at:
+            if args.mode == "ceil" or key == at:
+                return [(key, values)]
+            break
+    return []
+
+
+def query(args):
+    """
+    Print matching records from the store as CSV rows of timestamp and value.
+    The store is streamed from disk, so only the blocks around the requested keys are decoded.
+    :param args: Parsed command-line arguments.
+    :return: Exit status.
+    """
+    # --last needs the entries before the timestamp, so it scans from the start of the store
+    start_key = args.start if args.at is None else (None if args.last is not None else args.at)
+    results = select(scan_store(args.store, start_key), args)
+
+    writer = csv.writer(sys.stdout)
+    for key, values in results:
+        for value in values:
+            writer.writerow((key.isoformat(), value))
+    return 0
+
+
+def bench(args):
+    """
+    Run the benchmark suite, or only the startup-time check with --startup-only.
+    :param args: Parsed command-line arguments.
+    :return: Exit status; 1 if the import-time budget is exceeded.
+    """
+    try:
+        if args.startup_only:
+            from .benchmark import check_import_budget
+
+            check_import_budget()
+        else:
+            from .main import main as run_benchmarks  # Pulls in NumPy, only needed here
+
+            run_benchmarks()
+    except AssertionError as error:
+        print(f"tsdb: error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def serve(args):
+    """
+    Serve read-only queries over HTTP, answering with JSON.
+    Endpoints: /query?at=T, /floor?at=T, /ceil?at=T and /range?start=T&end=T.
+    :param args: Parsed command-line arguments.
+    :return: Exit status.
+    """
+    import json
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from urllib.parse import parse_qs, urlparse
+
+    tree = open_tree(args.store)
+
+    def lookup(path, params):
+        """
+        Run one request against the tree.
+        :param path: The request path, selecting the operation.
+        :param params: Parsed query-string parameters.
+        :return: A list of (key, values) pairs, or None for an unknown path.
+        """
+        if path == "/range":
+            return list(tree.iter_range(parse_timestamp(params["start"][0]),
+                                        parse_timestamp(params["end"][0])))
+        if path in ("/query", "/floor", "/ceil"):
+            at = parse_timestamp(params["at"][0])
+            if path == "/query":
+                values = tree.query(at)
+                return [(at, values)] if values is not None else []
+            result = tree.floor(at) if path == "/floor" else tree.ceil(at)
+            return [result] if result is not None else []
+        return None
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            try:
+                results = lookup(url.path, parse_qs(url.query))
+            except (KeyError, ValueError) as error:
+                self.send_error(400, f"Bad request: {error}")
+                return
+            if results is None:
+                self.send_error(404)
+                return
+            body = json.dumps([{"timestamp": key.isoformat(), "values": values} for key, values in results])
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body.encode("utf-8"))
+
+    server = HTTPServer((args.host, args.port), Handler)
+    print(f"Serving {args.store} on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line parser for the `tsdb` entry point.
+    :return: The argument parser.
+    """
+    parser = argparse.ArgumentParser(prog="tsdb", description="B+ Tree time-series database")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest_parser = commands.add_parser("ingest", help="import a CSV or binary file into a store")
+    ingest_parser.add_argument("source", help="file to import")
+    ingest_parser.add_argument("--store", default="tsdb.bin", help="store file (default: tsdb.bin)")
+    ingest_parser.add_argument("--format", choices=("csv", "binary"), help="source format (default: from extension)")
+    ingest_parser.add_argument("--header", action="store_true", help="skip the first CSV line")
+    ingest_parser.add_argument("--processes", type=int, default=0, help="parsing processes (default: 0, parse in this process)")
+    ingest_parser.set_defaults(handler=ingest)
+
+    query_parser = commands.add_parser("query", help="print records from a store as CSV")
+    query_parser.add_argument("--store", default="tsdb.bin", help="store file (default: tsdb.bin)")
+    target = query_parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--at", type=parse_timestamp, help="timestamp to look up")
+    target.add_argument("--start", type=parse_timestamp, help="start of a range")
+    query_parser.add_argument("--end", type=parse_timestamp, help="end of a range (default: last record)")
+    query_parser.add_argument("--mode", choices=("exact", "floor", "ceil"), default="exact",
+                              help="match for --at: exact key, last at or before, first at or after")
+    query_parser.add_argument("--last", type=int, help="with --at, print the last N records at or before it")
+    query_parser.set_defaults(handler=query)
+
+    bench_parser = commands.add_parser("bench", help="run the benchmark suite")
+    bench_parser.add_argument("--startup-only", action="store_true",
+                              help="only check that importing the CLI stays within its time budget")
+    bench_parser.set_defaults(handler=bench)
+
+    serve_parser = commands.add_parser("serve", help="serve read-only queries over HTTP")
+    serve_parser.add_argument("--store", default="tsdb.bin", help="store file (default: tsdb.bin)")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="address to bind (default: 127.0.0.1)")
+    serve_parser.add_argument("--port", type=int, default=8080, help="port to bind (default: 8080)")
+    serve_parser.set_defaults(handler=serve)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    """
+    Entry point of the `tsdb` command.
+    :param argv: Command-line arguments. If None, sys.argv is used.
+    :return: Exit status.
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except ValueError as error:
+        print(f"tsdb: error: {error}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
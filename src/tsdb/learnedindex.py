@@ -0,0 +1,252 @@
+import sys
+from bisect import bisect_right
+from datetime import datetime, timezone
+from numbers import Real
+
+_EPOCH = datetime(1970, 1, 1)  # Reference point for naive datetime keys
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)  # Reference point for aware datetime keys
+MAX_SEGMENT_LEAVES = 64  # Cap on leaves per segment, so refitting one stays cheap
+
+
+def _first_key(leaf):
+    """
+    Return the smallest key of a leaf, used to order the leaf chain.
+    :param leaf: The leaf node.
+    :return: The leaf's first key.
+    """
+    return leaf.keys[0]
+
+
+def _to_number(key):
+    """
+    Convert a key to a number so it can be fed to a linear model.
+    :param key: A datetime or numeric key.
+    :return: The key as a float (seconds since the epoch for datetimes), or None for other key types.
+    """
+    if isinstance(key, datetime):
+        # Subtracting avoids the local time conversion done by datetime.timestamp()
+        return (key - (_EPOCH if key.tzinfo is None else _EPOCH_UTC)).total_seconds()
+    if isinstance(key, Real):
+        return float(key)
+    return None  # Strings and other keys cannot be modelled; lookups fall back to tree descent
+
+
+class LearnedIndex(object):
+    """
+    Optional learned index over the leaf chain of a B+ Tree.
+    Piecewise-linear segments map a key to the predicted position of its leaf, with every
+    leaf's first key within `epsilon` positions of the prediction. Lookups search only that
+    window and return None when the key falls outside it, so callers fall back to tree descent.
+    Leaf splits and fusions are applied incrementally; a segment is refitted once the
+    positions it covers have drifted by more than `epsilon`. Segments cover at most
+    MAX_SEGMENT_LEAVES leaves, so a refit never rescans the whole chain.
+    Only datetime and numeric keys can be modelled; for other keys the index stays
+    disabled and every lookup falls back to tree descent.
+    Only the leaf is predicted, not the slot within it: a leaf holds at most the tree's
+    `maximum` keys, so scanning it costs less than evaluating a second model.
+    """
+
+    def __init__(self, tree, epsilon=4):
+        """
+        Initialize the index. Call build() before using it.
+        :param tree: The BPlusTree whose leaves are indexed.
+        :param epsilon: Maximum position error of each segment when fitted.
+        """
+        self.tree = tree
+        self.epsilon: int = epsilon
+        self.leaves: list = []  # Leaves in chain order
+        self.seg_keys: list = []  # First key of each segment, as a number
+        self.seg_pos: list[int] = []  # Leaf position where each segment starts
+        self.seg_slope: list[float] = []  # Leaves per key unit within each segment
+        self.seg_drift: list[int] = []  # Leaves inserted or removed in each segment since it was fitted
+        self.disabled: bool = False  # True once the tree holds keys that cannot be modelled
+        self.hits: int = 0  # Lookups answered by the model
+        self.fallbacks: int = 0  # Lookups that fell back to tree descent
+
+    def build(self):
+        """
+        Rebuild the index from scratch by walking the tree's leaf chain.
+        """
+        self.leaves = []
+        leaf = self.tree.leftmost_leaf()
+        while leaf is not None:
+            self.leaves.append(leaf)
+            leaf = leaf.next
+        self.seg_keys, self.seg_pos, self.seg_slope, self.seg_drift = [], [], [], []
+        if self.leaves and self.leaves[0].keys and _to_number(self.leaves[0].keys[0]) is None:
+            # Keys in a tree are mutually comparable, so one unmodellable key means all are
+            self.disabled = True
+            self.leaves = []
+        elif len(self.leaves) > 1:
+            self._fit(0, len(self.leaves), 0)
+
+    def _fit(self, start, end, at):
+        """
+        Fit segments over leaves[start:end] with a shrinking-cone greedy pass and splice them in.
+        :param start: First leaf position to cover.
+        :param end: Position after the last leaf to cover.
+        :param at: Segment index where the new segments are inserted.
+        """
+        xs = [_to_number(leaf.keys[0]) for leaf in self.leaves[start:end]]
+        epsilon = self.epsilon
+        keys, positions, slopes = [], [], []
+        i = 0
+        while i < len(xs):
+            x0 = xs[i]
+            low, high = 0.0, float("inf")  # Feasible slope range for the current segment
+            j = i + 1
+            stop = min(len(xs), i + MAX_SEGMENT_LEAVES)
+            while j < stop:
+                dx = xs[j] - x0
+                if dx <= 0:
+                    break
+                upper = (j - i + epsilon) / dx
+                lower = (j - i - epsilon) / dx
+                if lower > high or upper < low:
+                    break  # The cone is empty, so this leaf starts a new segment
+                if lower > low:
+                    low = lower
+                if upper < high:
+                    high = upper
+                j += 1
+            keys.append(x0)
+            positions.append(start + i)
+            slopes.append(low if high == float("inf") else (low + high) / 2)
+            i = j
+
+        self.seg_keys[at:at] = keys
+        self.seg_pos[at:at] = positions
+        self.seg_slope[at:at] = slopes
+        self.seg_drift[at:at] = [0] * len(keys)
+
+    def _window(self, key):
+        """
+        Predict the position of the leaf for a key and the window that must contain it.
+        :param key: The key to predict.
+        :return: A tuple (predicted, lo, hi) of leaf positions, hi exclusive; empty if the key cannot be modelled.
+        """
+        x = _to_number(key)
+        if x is None:
+            return 0, 0, 0
+        s = max(bisect_right(self.seg_keys, x) - 1, 0)  # Segment responsible for the key
+        predicted = int(self.seg_pos[s] + self.seg_slope[s] * (x - self.seg_keys[s]))
+        error = self.epsilon + self.seg_drift[s] + 1  # One extra position for rounding
+        return predicted, max(predicted - error, 0), min(predicted + error + 1, len(self.leaves))
+
+    def lookup(self, key):
+        """
+        Predict the leaf that should contain a key. Callers search the leaf's keys for the slot.
+        :param key: The key to find.
+        :return: The leaf node, or None if the key lies outside the error bound.
+        """
+        if len(self.leaves) == 1:
+            return self.leaves[0]  # A single leaf holds every key
+        if not self.seg_keys:
+            self.fallbacks += 1
+            return None
+
+        predicted, lo, hi = self._window(key)
+        if lo >= hi:
+            self.fallbacks += 1
+            return None
+
+        # Probe outwards from the prediction for the last leaf whose first key is <= key
+        leaves = self.leaves
+        i = min(max(predicted, lo), hi - 1)
+        if leaves[i].keys[0] <= key:
+            while i + 1 < hi and leaves[i + 1].keys[0] <= key:
+                i += 1
+        else:
+            i -= 1
+            while i >= lo and leaves[i].keys[0] > key:
+                i -= 1
+
+        # The answer must not depend on leaves outside the window
+        if (i < lo and lo > 0) or (i == hi - 1 and hi < len(self.leaves) and self.leaves[hi].keys[0] <= key):
+            self.fallbacks += 1
+            return None
+
+        self.hits += 1
+        return self.leaves[max(i, 0)]
+
+    def _position(self, leaf) -> int:
+        """
+        Find the position of a leaf in the index.
+        :param leaf: The leaf node to locate. Its keys must not be empty.
+        :return: The leaf's position.
+        """
+        if self.seg_keys:
+            _, lo, hi = self._window(leaf.keys[0])
+            for i in range(lo, hi):
+                if self.leaves[i] is leaf:
+                    return i
+
+        # Outside the predicted window, bisect the whole chain on the live first keys.
+        # A leaf merged into its next neighbor shares that neighbor's first key, so check both.
+        i = bisect_right(self.leaves, leaf.keys[0], key=_first_key) - 1
+        for candidate in (i, i - 1):
+            if 0 <= candidate < len(self.leaves) and self.leaves[candidate] is leaf:
+                return candidate
+        raise ValueError("leaf is not registered in the learned index")
+
+    def _shift(self, position, delta):
+        """
+        Record a leaf inserted or removed at a position, refitting the segment if it drifted too far.
+        :param position: Leaf position that changed.
+        :param delta: +1 for an inserted leaf, -1 for a removed leaf.
+        """
+        s = max(bisect_right(self.seg_pos, position) - 1, 0)  # Segment covering the position
+        self.seg_pos[s + 1:] = [pos + delta for pos in self.seg_pos[s + 1:]]  # Later segments move by one leaf
+        self.seg_drift[s] += 1
+
+        end = self.seg_pos[s + 1] if s + 1 < len(self.seg_pos) else len(self.leaves)
+        if end <= self.seg_pos[s]:
+            # The segment no longer covers any leaf
+            for segments in (self.seg_keys, self.seg_pos, self.seg_slope, self.seg_drift):
+                del segments[s]
+        elif self.seg_drift[s] > self.epsilon:
+            start = self.seg_pos[s]
+            for segments in (self.seg_keys, self.seg_pos, self.seg_slope, self.seg_drift):
+                del segments[s]
+            self._fit(start, end, s)
+
+    def leaf_split(self, left, right):
+        """
+        Register a leaf split: `left` was created immediately before `right` in the chain.
+        :param left: The new leaf holding the lower half of the keys.
+        :param right: The existing leaf holding the upper half of the keys.
+        """
+        if self.disabled:
+            return
+        if len(self.leaves) < 2 or not self.seg_keys:
+            self.build()
+            return
+        i = self._position(right)
+        self.leaves.insert(i, left)
+        self._shift(i, 1)
+
+    def leaf_removed(self, leaf):
+        """
+        Register a leaf that was merged into a neighbor and unlinked from the chain.
+        :param leaf: The removed leaf. Its keys must still be present.
+        """
+        if self.disabled:
+            return
+        if len(self.leaves) < 3 or not self.seg_keys:
+            self.build()
+            return
+        i = self._position(leaf)
+        del self.leaves[i]
+        self._shift(i, -1)
+        if not self.seg_keys:
+            self.build()
+
+    def memory(self) -> int:
+        """
+        Estimate the memory used by the index structures.
+        :return: Size in bytes of the leaf list and the segment arrays.
+        """
+        size = sys.getsizeof(self.leaves)
+        for segments in (self.seg_keys, self.seg_pos, self.seg_slope, self.seg_drift):
+            size += sys.getsizeof(segments) + sum(sys.getsizeof(item) for item in segments)
+        return size
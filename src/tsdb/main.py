@@ -0,0 +1,224 @@
+from .benchmark import benchmark_insertion, benchmark_query, benchmark_delete, benchmark_range_query  # Added range query benchmark
+from .benchmark import benchmark_nearest_query, benchmark_asof_join  # As-of lookup benchmarks
+from .benchmark import benchmark_percentile, benchmark_topk  # Sketch-based aggregate benchmarks
+from .benchmark import benchmark_learned_query, index_memory  # Learned index benchmarks
+from .benchmark import benchmark_sorted_insert, benchmark_bulk_io, check_import_budget  # Bulk import/export and startup benchmarks
+from .database import setup_database  # Import function to set up the SQLite database
+from .bplustree import BPlusTree  # Import the B+ Tree implementation
+from .syntheticdata import generate_data, generate_random_data, generate_latency_data  # Import functions to generate synthetic data
+from .benchmark import plot_results  # Import function to plot query performance results
+import numpy as np  # Import for calculating summary statistics
+from datetime import timedelta  # Import for range query time intervals
+
+def summarize_metrics(metrics):
+    """
+    Summarize the performance metrics: mean, standard deviation, min, and max.
+    """
+    return {
+        "mean": np.mean(metrics),
+        "std": np.std(metrics),
+        "min": np.min(metrics),
+        "max": np.max(metrics)
+    }
+
+def print_summary(summary, label):
+    """
+    Print a summary of performance metrics.
+    """
+    print(f"\n{label} Summary:")
+    print(f"Mean: {summary['mean']:.6f} seconds")
+    print(f"Standard Deviation: {summary['std']:.6f} seconds")
+    print(f"Min: {summary['min']:.6f} seconds")
+    print(f"Max: {summary['max']:.6f} seconds")
+
+def print_accuracy(errors, label):
+    """
+    Print a summary of accuracy metrics.
+    """
+    print(f"\n{label} Accuracy:")
+    print(f"Mean: {np.mean(errors):.6f}")
+    print(f"Max: {np.max(errors):.6f}")
+
+def main():
+    # Parameters
+    num_trials = 10
+    num_records = 100000
+    num_queries = 100
+    num_bulk_records = 10000000
+
+    # Fail fast if short-lived CLI processes no longer start within budget
+    check_import_budget()
+
+    # Initialize storage for performance metrics
+    insertion_times = []
+    insert_loop_times = []
+    insert_sorted_times = []
+    query_tree_times = []
+    query_sql_times = []
+    deletion_tree_times = []
+    deletion_sql_times = []
+    range_tree_times = []
+    range_sql_times = []
+    floor_times = []
+    ceil_times = []
+    asof_join_times = []
+    asof_lookup_times = []
+    percentile_sketch_times = []
+    percentile_exact_times = []
+    percentile_errors = []
+    topk_sketch_times = []
+    topk_exact_times = []
+    topk_recalls = []
+    learned_query_times = {"uniform": ([], []), "random": ([], [])}
+    learned_memory = {"uniform": [], "random": []}
+
+    for trial in range(num_trials):
+        print(f"\nRunning Trial {trial + 1}/{num_trials}...")
+
+        # Initialize the SQLite database connection and cursor
+        conn, cursor = setup_database()
+
+        # Create an instance of the B+ Tree for in-memory operations
+        tree = BPlusTree()
+
+        # Generate a dataset
+        dataset = generate_data(num_records)
+
+        # Benchmark insertion
+        print("Benchmarking Insertion...")
+        insertion_time = benchmark_insertion(tree, cursor, dataset)
+        insertion_times.append(insertion_time)
+
+        # Benchmark batch insertion of the already sorted dataset against one insert() per key
+        print("Benchmarking Sorted Batch Insertion...")
+        loop_time, sorted_time = benchmark_sorted_insert(dataset)
+        insert_loop_times.append(loop_time)
+        insert_sorted_times.append(sorted_time)
+
+        # Prepare query timestamps
+        queries = [record[0] for record in dataset[:num_queries]]
+
+        # Benchmark queries
+        print("Benchmarking Queries...")
+        tree_times, sql_times = benchmark_query(tree, cursor, queries)
+        query_tree_times.append(sum(tree_times) / len(tree_times))
+        query_sql_times.append(sum(sql_times) / len(sql_times))
+
+        # Generate range queries
+        ranges = [(record[0], record[0] + timedelta(seconds=10)) for record in dataset[:num_queries]]
+
+        # Benchmark range queries
+        print("Benchmarking Range Queries...")
+        tree_range_times, sql_range_times = benchmark_range_query(tree, cursor, ranges)
+        range_tree_times.append(sum(tree_range_times) / len(tree_range_times))
+        range_sql_times.append(sum(sql_range_times) / len(sql_range_times))
+
+        # Benchmark as-of lookups between the query timestamps
+        print("Benchmarking As-Of Queries...")
+        nearest = [record[0] + timedelta(milliseconds=500) for record in dataset[:num_queries]]
+        tree_floor_times, tree_ceil_times = benchmark_nearest_query(tree, nearest)
+        floor_times.append(sum(tree_floor_times) / len(tree_floor_times))
+        ceil_times.append(sum(tree_ceil_times) / len(tree_ceil_times))
+
+        # Benchmark an as-of join against a second, offset stream
+        other_tree = BPlusTree()
+        for timestamp, value in dataset[::3]:
+            other_tree.insert(timestamp + timedelta(milliseconds=250), value)
+        join_time, lookup_time = benchmark_asof_join(tree, other_tree, dataset[0][0], dataset[-1][0], timedelta(seconds=2))
+        asof_join_times.append(join_time)
+        asof_lookup_times.append(lookup_time)
+
+        # Benchmark p99 and top-k over one-hour windows of numeric latencies
+        print("Benchmarking Percentile and Top-K Queries...")
+        latency_tree = BPlusTree()
+        latency_dataset = generate_latency_data(num_records)
+        latency_tree.insert_sorted(latency_dataset)
+        windows = [(record[0], record[0] + timedelta(hours=1)) for record in latency_dataset[:num_queries]]
+        sketch_times, exact_times, rank_errors = benchmark_percentile(latency_tree, windows, 0.99)
+        percentile_sketch_times.append(sum(sketch_times) / len(sketch_times))
+        percentile_exact_times.append(sum(exact_times) / len(exact_times))
+        percentile_errors.extend(rank_errors)
+        sketch_times, exact_times, recalls = benchmark_topk(latency_tree, windows, 10)
+        topk_sketch_times.append(sum(sketch_times) / len(sketch_times))
+        topk_exact_times.append(sum(exact_times) / len(exact_times))
+        topk_recalls.extend(recalls)
+
+        # Benchmark point queries through the learned index on uniform and random timestamps
+        print("Benchmarking Learned Index Queries...")
+        random_tree = BPlusTree()
+        random_dataset = generate_random_data(num_records)
+        for timestamp, value in random_dataset:
+            random_tree.insert(timestamp, value)
+        for label, learned_tree, records in (("uniform", tree, dataset), ("random", random_tree, random_dataset)):
+            learned_tree.enable_learned_index()
+            tree_times, learned_times = benchmark_learned_query(learned_tree, [record[0] for record in records[:num_queries]])
+            learned_query_times[label][0].append(sum(tree_times) / len(tree_times))
+            learned_query_times[label][1].append(sum(learned_times) / len(learned_times))
+            learned_memory[label].append(index_memory(learned_tree))
+            learned_tree.learned = None  # Keep the deletion benchmark measuring the B+ Tree alone
+
+        # Benchmark deletion
+        print("Benchmarking Deletion...")
+        deletion_tree_time, deletion_sql_time = benchmark_delete(tree, cursor, dataset)
+        deletion_tree_times.append(sum(deletion_tree_time) / len(deletion_tree_time))
+        deletion_sql_times.append(sum(deletion_sql_time) / len(deletion_sql_time))
+
+        # Close the database connection
+        conn.close()
+
+    # Summarize performance metrics
+    insertion_summary = summarize_metrics(insertion_times)
+    insert_loop_summary = summarize_metrics(insert_loop_times)
+    insert_sorted_summary = summarize_metrics(insert_sorted_times)
+    query_tree_summary = summarize_metrics(query_tree_times)
+    query_sql_summary = summarize_metrics(query_sql_times)
+    range_tree_summary = summarize_metrics(range_tree_times)
+    range_sql_summary = summarize_metrics(range_sql_times)
+    floor_summary = summarize_metrics(floor_times)
+    ceil_summary = summarize_metrics(ceil_times)
+    asof_join_summary = summarize_metrics(asof_join_times)
+    asof_lookup_summary = summarize_metrics(asof_lookup_times)
+    percentile_sketch_summary = summarize_metrics(percentile_sketch_times)
+    percentile_exact_summary = summarize_metrics(percentile_exact_times)
+    topk_sketch_summary = summarize_metrics(topk_sketch_times)
+    topk_exact_summary = summarize_metrics(topk_exact_times)
+    learned_summaries = {
+        label: (summarize_metrics(tree_times), summarize_metrics(learned_times))
+        for label, (tree_times, learned_times) in learned_query_times.items()
+    }
+    deletion_tree_summary = summarize_metrics(deletion_tree_times)
+    deletion_sql_summary = summarize_metrics(deletion_sql_times)
+
+    # Print summaries
+    print_summary(insertion_summary, "Insertion")
+    print_summary(insert_loop_summary, "Sorted Insertion (insert per Key)")
+    print_summary(insert_sorted_summary, "Sorted Insertion (insert_sorted)")
+    print_summary(query_tree_summary, "Query (B+ Tree)")
+    print_summary(query_sql_summary, "Query (SQL Database)")
+    print_summary(range_tree_summary, "Range Query (B+ Tree)")
+    print_summary(range_sql_summary, "Range Query (SQL Database)")
+    print_summary(floor_summary, "Floor Query (B+ Tree)")
+    print_summary(ceil_summary, "Ceil Query (B+ Tree)")
+    print_summary(asof_join_summary, "As-Of Join (Leaf Chain Merge)")
+    print_summary(asof_lookup_summary, "As-Of Join (Floor per Timestamp)")
+    print_summary(percentile_sketch_summary, "P99 Query (Sketch)")
+    print_summary(percentile_exact_summary, "P99 Query (Exact Sort)")
+    print_accuracy(percentile_errors, "P99 Query (Sketch) Rank Error")
+    print_summary(topk_sketch_summary, "Top-10 Query (Heap)")
+    print_summary(topk_exact_summary, "Top-10 Query (Exact Sort)")
+    print_accuracy(topk_recalls, "Top-10 Query (Heap) Recall")
+    for label, (tree_summary, learned_summary) in learned_summaries.items():
+        print_summary(tree_summary, f"Query, {label} timestamps (B+ Tree Descent)")
+        print_summary(learned_summary, f"Query, {label} timestamps (Learned Index)")
+        tree_bytes, learned_bytes = learned_memory[label][-1]
+        print(f"Index memory: {tree_bytes} bytes (internal nodes) vs {learned_bytes} bytes (learned index)")
+    print_summary(deletion_tree_summary, "Deletion (B+ Tree)")
+    print_summary(deletion_sql_summary, "Deletion (SQL Database)")
+
+    # Benchmark bulk import and export once, outside the trials
+    print(f"\nBenchmarking Bulk Import/Export of {num_bulk_records} rows...")
+    for operation, rate in benchmark_bulk_io(num_bulk_records).items():
+        print(f"{operation}: {rate:,.0f} rows/sec")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import heapq
+from math import ceil
+
+# Default sizes for the per-node summaries kept by the B+ Tree
+SKETCH_SIZE = 200  # Items held per compactor level of a quantile sketch
+TOPK_SIZE = 16  # Largest values retained by a top-k heap
+
+
+class QuantileSketch(object):
+    """
+    Mergeable quantile sketch built from a hierarchy of compactors (KLL style).
+    Level h holds items that each stand for 2^h original items. When a level overflows,
+    it is sorted and every other item is promoted to the next level.
+    Only comparisons are needed, so any ordered value type can be summarized.
+    """
+
+    def __init__(self, k=SKETCH_SIZE):
+        """
+        Initialize an empty sketch.
+        :param k: Maximum number of items per level. Larger values trade memory for accuracy.
+        """
+        self.k: int = k
+        self.levels: list[list] = [[]]  # Compactor levels, lowest weight first
+        self.count: int = 0  # Number of original items summarized
+        self._offset: int = 0  # Alternates which half of a level is promoted
+
+    def update(self, item):
+        """
+        Add a single item to the sketch.
+        :param item: The value to add.
+        """
+        self.levels[0].append(item)
+        self.count += 1
+        if len(self.levels[0]) > self.k:
+            self._compress()
+
+    def merge(self, other):
+        """
+        Fold another sketch into this one. The other sketch is left unchanged.
+        :param other: The QuantileSketch to merge.
+        :return: This sketch, for chaining.
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for level, items in zip(self.levels, other.levels):
+            level.extend(items)
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _compress(self):
+        """
+        Compact every level that exceeds its capacity, promoting half of its items upwards.
+        """
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self.k:
+                level.sort()
+                # Keep one item behind on odd lengths so total weight is preserved
+                keep = [level.pop()] if len(level) % 2 else []
+                promoted = level[self._offset::2]
+                self._offset ^= 1
+                self.levels[h] = keep
+                if h + 1 == len(self.levels):
+                    self.levels.append([])
+                self.levels[h + 1].extend(promoted)
+            h += 1
+
+    def quantile(self, q):
+        """
+        Estimate the q-quantile using the nearest-rank definition.
+        :param q: Quantile in [0, 1], e.g. 0.99 for the 99th percentile.
+        :return: The estimated value, or None if the sketch is empty.
+        """
+        if self.count == 0:
+            return None
+        weighted = sorted((item, 1 << h) for h, level in enumerate(self.levels) for item in level)
+        target = max(1, ceil(q * self.count))  # Rank of the requested item
+        total = 0
+        for item, weight in weighted:
+            total += weight
+            if total >= target:
+                return item
+        return weighted[-1][0]
+
+
+class TopK(object):
+    """
+    Bounded min-heap retaining the largest values seen. Mergeable and exact up to its capacity.
+    """
+
+    def __init__(self, capacity=TOPK_SIZE):
+        """
+        Initialize an empty heap.
+        :param capacity: Number of largest values to retain.
+        """
+        self.capacity: int = capacity
+        self.heap: list = []
+
+    def update(self, item):
+        """
+        Offer a value to the heap.
+        :param item: The value to add.
+        """
+        if len(self.heap) < self.capacity:
+            heapq.heappush(self.heap, item)
+        elif item > self.heap[0]:
+            heapq.heapreplace(self.heap, item)  # Evict the smallest retained value
+
+    def merge(self, other):
+        """
+        Fold another heap into this one. The other heap is left unchanged.
+        :param other: The TopK to merge.
+        :return: This heap, for chaining.
+        """
+        for item in other.heap:
+            self.update(item)
+        return self
+
+    def largest(self, k):
+        """
+        Return the k largest retained values.
+        :param k: Number of values to return (at most the capacity).
+        :return: A list of values in descending order.
+        """
+        return heapq.nlargest(k, self.heap)
+
+
+class Summary(object):
+    """
+    Quantile sketch and top-k heap describing every value stored below a B+ Tree node.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty summary.
+        """
+        self.sketch = QuantileSketch()
+        self.top = TopK()
+
+    def update(self, item):
+        """
+        Add a single value to the summary.
+        :param item: The value to add.
+        """
+        self.sketch.update(item)
+        self.top.update(item)
+
+    def merge(self, other):
+        """
+        Fold another summary into this one. The other summary is left unchanged.
+        :param other: The Summary to merge.
+        :return: This summary, for chaining.
+        """
+        self.sketch.merge(other.sketch)
+        self.top.merge(other.top)
+        return self
@@ -1,3 +1,4 @@
+import csv
 import random
 from datetime import datetime, timedelta
 
@@ -30,3 +31,29 @@ def generate_random_data(count):
     # Shuffle the list to make the order of timestamps more random
     random.shuffle(data)
     return data
+
+
+def generate_latency_data(count):
+    """
+    Generate a list of timestamped request latencies, one per second.
+
+    :param count: Number of data points to generate.
+    :return: A list of tuples with ascending timestamps and float latencies in milliseconds.
+    """
+    base_time = datetime.now()  # Starting point for generating timestamps
+    # Latencies are log-normal, giving the long right tail that p99 and top-k queries look at
+    return [(base_time + timedelta(seconds=i), random.lognormvariate(3, 0.75)) for i in range(count)]
+
+
+def write_data_csv(path, count):
+    """
+    Write `count` rows shaped like generate_data() to a CSV file without holding them in memory.
+
+    :param path: Path of the CSV file to write.
+    :param count: Number of rows to generate.
+    """
+    base_time = datetime.now()  # Starting point for generating timestamps
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        for i in range(count):
+            writer.writerow(((base_time + timedelta(seconds=i)).isoformat(), f"value_{i}"))